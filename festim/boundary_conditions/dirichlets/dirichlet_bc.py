@@ -108,14 +108,12 @@ class BoundaryConditionTheta(f.UserExpression):
         super().__init__(kwargs)
         self._bci = bci
         self._vm = vm
-        self._mesh = vm.mesh()
         self._T = T
         self._materials = materials
+        self._find_material = materials.create_material_finder(vm)
 
     def eval_cell(self, value, x, ufc_cell):
-        cell = f.Cell(self._mesh, ufc_cell.index)
-        subdomain_id = self._vm[cell]
-        material = self._materials.find_material_from_id(subdomain_id)
+        material = self._find_material(ufc_cell.index)
         S_0 = material.S_0
         E_S = material.E_S
         c = self._bci(x)
@@ -70,41 +70,41 @@ class Mobile(Concentration):
             if not isinstance(subdomains, list):
                 subdomains = [subdomains]  # make sure subdomains is a list
 
+            # the diffusion coefficient is the same for all the subdomains
+            # of a material
+            D = D_0 * exp(-E_D / k_B / T.T)
+
             # add to the formulation F for every subdomain
+            # the transient and diffusion terms are summed in one integrand
+            # so that there is only one integral per subdomain
             for subdomain in subdomains:
                 dx = mesh.dx(subdomain)
+                integrand = 0
                 # transient form
                 if dt is not None:
-                    F += ((c_0 - c_0_n) / dt.value) * self.test_function * dx
-                D = D_0 * exp(-E_D / k_B / T.T)
+                    integrand += ((c_0 - c_0_n) / dt.value) * self.test_function
                 if mesh.type == "cartesian":
-                    F += dot(D * grad(c_0), grad(self.test_function)) * dx
+                    integrand += dot(D * grad(c_0), grad(self.test_function))
                     if soret:
                         Q = material.Q
                         if callable(Q):
                             Q = Q(T.T)
-                        F += (
-                            dot(
-                                D * Q * c_0 / (k_B * T.T**2) * grad(T.T),
-                                grad(self.test_function),
-                            )
-                            * dx
+                        integrand += dot(
+                            D * Q * c_0 / (k_B * T.T**2) * grad(T.T),
+                            grad(self.test_function),
                         )
 
                 # see https://fenicsproject.discourse.group/t/method-of-manufactured-solution-cylindrical/7963
                 elif mesh.type == "cylindrical":
                     r = SpatialCoordinate(mesh.mesh)[0]
-                    F += r * dot(D * grad(c_0), grad(self.test_function / r)) * dx
+                    integrand += r * dot(D * grad(c_0), grad(self.test_function / r))
 
                 elif mesh.type == "spherical":
                     r = SpatialCoordinate(mesh.mesh)[0]
-                    F += (
-                        D
-                        * r
-                        * r
-                        * dot(grad(c_0), grad(self.test_function / r / r))
-                        * dx
+                    integrand += (
+                        D * r * r * dot(grad(c_0), grad(self.test_function / r / r))
                     )
+                F += integrand * dx
 
         # add the trapping terms
         F_trapping = 0
@@ -130,15 +130,11 @@ class Mobile(Concentration):
                         * c_m
                         * (density - trap.solution)
                         * self.test_function
-                        * dx(mat.id)
-                    )
-                    F_trapping += (
-                        p_0
+                        + p_0
                         * exp(-E_p / k_B / T.T)
                         * trap.solution
                         * self.test_function
-                        * dx(mat.id)
-                    )
+                    ) * dx(mat.id)
         F += -F_trapping
 
         self.F_diffusion = F
@@ -35,6 +35,7 @@ class SurfaceFlux(SurfaceQuantity):
 
     def __init__(self, field, surface) -> None:
         super().__init__(field=field, surface=surface)
+        self._compiled_forms = {}
 
     @property
     def export_unit(self):
@@ -70,18 +71,56 @@ class SurfaceFlux(SurfaceQuantity):
         }
         return field_to_prop[self.field]
 
+    def get_compiled_form(self, name, create_form):
+        """Returns a compiled form that can be assembled at each time step.
+        The form is only created and compiled again if one of the objects
+        it depends on (function, property, measure...) has changed since
+        the last call.
+
+        Args:
+            name (str): the name of the form in the cache
+            create_form (callable): function with no argument returning
+                the ufl.Form
+
+        Returns:
+            fenics.Form: the compiled form
+        """
+        dependencies = (
+            self.function,
+            self.prop,
+            self.n,
+            self.ds,
+            self.Q,
+            getattr(self, "T", None),
+        )
+        if name in self._compiled_forms:
+            old_dependencies, form = self._compiled_forms[name]
+            if all(old is new for old, new in zip(old_dependencies, dependencies)):
+                return form
+        form = f.Form(create_form())
+        self._compiled_forms[name] = (dependencies, form)
+        return form
+
     def compute(self, soret=False):
         flux = f.assemble(
-            self.prop * f.dot(f.grad(self.function), self.n) * self.ds(self.surface)
+            self.get_compiled_form(
+                "flux",
+                lambda: self.prop
+                * f.dot(f.grad(self.function), self.n)
+                * self.ds(self.surface),
+            )
         )
         if soret and self.field in [0, "0", "solute"]:
             flux += f.assemble(
-                self.prop
-                * self.function
-                * self.Q
-                / (k_B * self.T**2)
-                * f.dot(f.grad(self.T), self.n)
-                * self.ds(self.surface)
+                self.get_compiled_form(
+                    "soret",
+                    lambda: self.prop
+                    * self.function
+                    * self.Q
+                    / (k_B * self.T**2)
+                    * f.dot(f.grad(self.T), self.n)
+                    * self.ds(self.surface),
+                )
             )
         return flux
 
@@ -154,10 +193,13 @@ class SurfaceFluxCylindrical(SurfaceFlux):
         # in both cases the expression with self.ds is the same
 
         flux = f.assemble(
-            self.prop
-            * self.r
-            * f.dot(f.grad(self.function), self.n)
-            * self.ds(self.surface)
+            self.get_compiled_form(
+                "flux",
+                lambda: self.prop
+                * self.r
+                * f.dot(f.grad(self.function), self.n)
+                * self.ds(self.surface),
+            )
         )
         flux *= self.azimuth_range[1] - self.azimuth_range[0]
         return flux
@@ -245,10 +287,13 @@ class SurfaceFluxSpherical(SurfaceFlux):
         # integral(f dS_r) = integral(f r^2 sin(theta) dtheta dphi)
         #                  = (phi2 - phi1) * (-cos(theta2) + cos(theta1)) * f r^2
         flux = f.assemble(
-            self.prop
-            * self.r**2
-            * f.dot(f.grad(self.function), self.n)
-            * self.ds(self.surface)
+            self.get_compiled_form(
+                "flux",
+                lambda: self.prop
+                * self.r**2
+                * f.dot(f.grad(self.function), self.n)
+                * self.ds(self.surface),
+            )
         )
         flux *= (self.polar_range[1] - self.polar_range[0]) * (
             -np.cos(self.azimuth_range[1]) + np.cos(self.azimuth_range[0])
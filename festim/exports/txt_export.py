@@ -29,6 +29,8 @@ class TXTExport(festim.Export):
         self.filename = filename
         self.header_format = header_format
         self._first_time = True
+        self._V_DG1 = None
+        self._x_column = None
 
     @property
     def filename(self):
@@ -60,12 +62,16 @@ class TXTExport(festim.Export):
         return None
 
     def write(self, current_time, steady):
-        # create a DG1 functionspace
-        V_DG1 = f.FunctionSpace(self.function.function_space().mesh(), "DG", 1)
-
-        solution = f.project(self.function, V_DG1)
-        solution_column = np.transpose(solution.vector()[:])
         if self.is_it_time_to_export(current_time):
+            # create a DG1 functionspace, only once per mesh
+            mesh = self.function.function_space().mesh()
+            if self._V_DG1 is None or self._V_DG1.mesh().id() != mesh.id():
+                self._V_DG1 = f.FunctionSpace(mesh, "DG", 1)
+                x = f.interpolate(f.Expression("x[0]", degree=1), self._V_DG1)
+                self._x_column = x.vector().get_local()
+
+            solution = f.project(self.function, self._V_DG1)
+            solution_column = solution.vector().get_local()
             # if the directory doesn't exist
             # create it
             dirname = os.path.dirname(self.filename)
@@ -80,9 +86,7 @@ class TXTExport(festim.Export):
                     header = "x,t=steady"
                 else:
                     header = f"x,t={format(current_time, self.header_format)}s"
-                x = f.interpolate(f.Expression("x[0]", degree=1), V_DG1)
-                x_column = np.transpose([x.vector()[:]])
-                data = np.column_stack([x_column, solution_column])
+                data = np.column_stack([self._x_column, solution_column])
                 self._first_time = False
             else:
                 # Update the header
@@ -111,11 +115,15 @@ class TXTExports:
     """
 
     def __init__(
-        self, fields=[], filenames=[], times=None, header_format=".2e"
+        self, fields=None, filenames=None, times=None, header_format=".2e"
     ) -> None:
         msg = "TXTExports class will be deprecated in future versions of FESTIM"
         warnings.warn(msg, DeprecationWarning)
 
+        if fields is None:
+            fields = []
+        if filenames is None:
+            filenames = []
         self.fields = fields
         if len(self.fields) != len(filenames):
             raise ValueError(
@@ -3,6 +3,7 @@ from festim.h_transport_problem import HTransportProblem
 from fenics import *
 import numpy as np
 import sympy as sp
+import time
 import warnings
 
 
@@ -72,19 +73,21 @@ class Simulation:
         mobile (festim.Mobile): the mobile concentration (c_m or theta)
         t (fenics.Constant): the current time of simulation
         timer (fenics.timer): the elapsed time of simulation
+        display_interval (float): minimum elapsed time (s) between two
+            refreshes of the progress message. Defaults to 0.5.
     """
 
     def __init__(
         self,
         mesh=None,
         materials=None,
-        sources=[],
-        boundary_conditions=[],
+        sources=None,
+        boundary_conditions=None,
         traps=None,
         dt=None,
         settings=None,
         temperature=None,
-        initial_conditions=[],
+        initial_conditions=None,
         exports=None,
         log_level=40,
     ):
@@ -96,17 +99,26 @@ class Simulation:
         self.traps = traps
         self.materials = materials
 
-        self.boundary_conditions = boundary_conditions
-        self.initial_conditions = initial_conditions
+        self.boundary_conditions = (
+            [] if boundary_conditions is None else boundary_conditions
+        )
+        self.initial_conditions = (
+            [] if initial_conditions is None else initial_conditions
+        )
         self.T = temperature
         self.exports = exports
         self.mesh = mesh
-        self.sources = sources
+        self.sources = [] if sources is None else sources
 
         # internal attributes
         self.h_transport_problem = None
         self.t = 0  # Initialising time to 0s
         self.timer = None
+        self.display_interval = 0.5
+        self._last_display_time = None
+        self._final_time = None
+        self._final_time_tolerance = None
+        self._retention = None
 
     @property
     def traps(self):
@@ -305,6 +317,7 @@ class Simulation:
         # initialise dt
         if self.settings.transient:
             self.dt.initialise_value()
+            self._set_final_time()
 
         self.h_transport_problem = HTransportProblem(
             self.mobile, self.traps, self.T, self.settings, self.initial_conditions
@@ -365,11 +378,19 @@ class Simulation:
             "cylindrical": [festim.SurfaceFluxCylindrical] + all_types_quantities,
             "spherical": [festim.SurfaceFluxSpherical] + all_types_quantities,
         }
+        allowed_types = tuple(allowed_quantities[self.mesh.type])
+
+        # filter the SurfaceKinetics BCs once rather than for each quantity
+        surf_kin_bcs = [
+            bc
+            for bc in self.boundary_conditions
+            if isinstance(bc, festim.SurfaceKinetics)
+        ]
 
         for export in self.exports:
             if isinstance(export, festim.DerivedQuantities):
                 for q in export:
-                    if not isinstance(q, tuple(allowed_quantities[self.mesh.type])):
+                    if not isinstance(q, allowed_types):
                         warnings.warn(
                             f"{type(q)} may not work as intended for {self.mesh.type} meshes"
                         )
@@ -378,9 +399,7 @@ class Simulation:
                         # check that festim.AdsorbedHydrogen is defined together with
                         # festim.SurfaceKinetics on the same surface
                         surf_kin_present = any(
-                            q.surface in bc.surfaces
-                            for bc in self.boundary_conditions
-                            if isinstance(bc, festim.SurfaceKinetics)
+                            q.surface in bc.surfaces for bc in surf_kin_bcs
                         )
 
                         if not surf_kin_present:
@@ -417,6 +436,7 @@ class Simulation:
             dict: output containing solutions, mesh, derived quantities
         """
         self.timer = Timer()  # start timer
+        self._last_display_time = None
 
         if self.settings.transient:
             self.run_transient()
@@ -439,11 +459,20 @@ class Simulation:
 
         #  Time-stepping
         print("Time stepping...")
-        while self.t < self.settings.final_time and not np.isclose(
-            self.t, self.settings.final_time, atol=0
-        ):
+        self._set_final_time()
+        final_time = self._final_time
+        tolerance = self._final_time_tolerance
+        while self.t < final_time and abs(self.t - final_time) > tolerance:
             self.iterate()
 
+    def _set_final_time(self):
+        """Stores the final time and the tolerance used to detect it so that
+        they aren't looked up at each time step"""
+        self._final_time = self.settings.final_time
+        # same as np.isclose(t, final_time, atol=0) without calling numpy
+        # on scalars at each step
+        self._final_time_tolerance = 1e-05 * abs(self._final_time)
+
     def run_steady(self):
         # Solve steady state
         print("Solving steady state problem...")
@@ -480,20 +509,34 @@ class Simulation:
 
         # avoid t > final_time
         next_time = self.t + float(self.dt.value)
-        if next_time > self.settings.final_time:
-            self.dt.value.assign(self.settings.final_time - self.t)
+        if next_time > self._final_time:
+            self.dt.value.assign(self._final_time - self.t)
 
     def display_time(self):
-        """Displays the current time"""
-        simulation_percentage = round(self.t / self.settings.final_time * 100, 2)
-        elapsed_time = round(self.timer.elapsed()[0], 1)
+        """Displays the current time.
+        When the message is overwritten on the same line (log_level 40), it
+        is refreshed at most every self.display_interval seconds of elapsed
+        time. The final time is always displayed.
+        """
+        overwrite = (
+            self.log_level == 40
+            and abs(self.t - self._final_time) > self._final_time_tolerance
+        )
+        if overwrite:
+            now = time.perf_counter()
+            if (
+                self._last_display_time is not None
+                and now - self._last_display_time < self.display_interval
+            ):
+                return
+            self._last_display_time = now
+
+        elapsed_time = self.timer.elapsed()[0]
+        simulation_percentage = round(self.t / self._final_time * 100, 2)
         msg = "{:.1f} %        ".format(simulation_percentage)
         msg += "{:.1e} s".format(self.t)
-        msg += "    Elapsed time so far: {:.1f} s".format(elapsed_time)
-        if (
-            not np.isclose(self.t, self.settings.final_time, atol=0)
-            and self.log_level == 40
-        ):
+        msg += "    Elapsed time so far: {:.1f} s".format(round(elapsed_time, 1))
+        if overwrite:
             print(msg, end="\r")
         else:
             print(msg)
@@ -505,6 +548,30 @@ class Simulation:
         self.exports.t = self.t
         self.exports.write(self.label_to_function, self.mesh.dx)
 
+    def get_retention(self):
+        """Returns the retention (sum of the mobile and trapped
+        concentrations). The expression is only rebuilt if one of the
+        post-processing solutions has changed since the last call.
+
+        Returns:
+            ufl.core.expr.Expr: the retention
+        """
+        components = [self.mobile.post_processing_solution] + [
+            trap.post_processing_solution for trap in self.traps
+        ]
+        if self._retention is None or len(self._retention[0]) != len(components):
+            changed = True
+        else:
+            changed = any(
+                old is not new for old, new in zip(self._retention[0], components)
+            )
+        if changed:
+            retention = components[0]
+            for component in components[1:]:
+                retention = retention + component
+            self._retention = (components, retention)
+        return self._retention[1]
+
     def update_post_processing_solutions(self):
         """Creates the post-processing functions by splitting self.u. Projects
         the function on a suitable functionspace if needed.
@@ -520,10 +587,7 @@ class Simulation:
             "0": self.mobile.post_processing_solution,
             0: self.mobile.post_processing_solution,
             "T": self.T.T,
-            "retention": sum(
-                [self.mobile.post_processing_solution]
-                + [trap.post_processing_solution for trap in self.traps]
-            ),
+            "retention": self.get_retention(),
             # dictionary {"post_processing_solutions": bc.post_processing_solutions, "surfaces": bc.surfaces}
             # for each SurfaceKinetics boundary condition
             "adsorbed": [
@@ -22,6 +22,10 @@ class HTransportProblem:
             ct2, ...)
         v (fenics.TestFunction): the test function
         u_n (fenics.Function): the "previous" function
+        u_backup (fenics.Function): copy of the initial guess of the current
+            time step, used to restart the solver if it doesn't converge
+        u_split (tuple): self.u and the list of its sub functions, reused for
+            post processing
         newton_solver (fenics.NewtonSolver): Newton solver for solving the nonlinear problem
         bcs (list): list of fenics.DirichletBC for H transport
     """
@@ -37,6 +41,8 @@ class HTransportProblem:
         self.u = None
         self.v = None
         self.u_n = None
+        self.u_backup = None
+        self.u_split = None
         self.newton_solver = None
 
         self.boundary_conditions = []
@@ -144,6 +150,8 @@ class HTransportProblem:
         Args:
             materials (festim.Materials): the materials
         """
+        all_surf_kinetics = self._all_surf_kinetics
+
         # TODO rename u and u_n to c and c_n
         self.u = Function(self.V, name="c")  # Function for concentrations
         self.v = TestFunction(self.V)  # TestFunction for concentrations
@@ -157,9 +165,10 @@ class HTransportProblem:
             conc_list = [self.mobile]
             if self.traps:
                 conc_list += [*self.traps]
-            if len(self._all_surf_kinetics) > 0:
-                conc_list += self._all_surf_kinetics
+            conc_list += all_surf_kinetics
 
+            # split once rather than for each concentration
+            test_functions = split(self.v)
             index = 0
             for concentration in conc_list:
                 if isinstance(concentration, festim.SurfaceKinetics):
@@ -167,12 +176,12 @@ class HTransportProblem:
                     for i in range(len(concentration.surfaces)):
                         concentration.solutions[i] = self.u.sub(index)
                         concentration.previous_solutions[i] = self.u_n.sub(index)
-                        concentration.test_functions[i] = list(split(self.v))[index]
+                        concentration.test_functions[i] = test_functions[index]
                         index += 1
                 else:
                     concentration.solution = self.u.sub(index)
                     concentration.previous_solution = self.u_n.sub(index)
-                    concentration.test_function = list(split(self.v))[index]
+                    concentration.test_function = test_functions[index]
                     index += 1
 
         print("Defining initial values")
@@ -184,6 +193,14 @@ class HTransportProblem:
         for i, trap in enumerate(self.traps, 1):
             field_to_component[trap.id] = i
             field_to_component[str(trap.id)] = i
+        # collapsed sub function spaces, only collapsed once per component
+        collapsed_spaces = {}
+
+        def get_collapsed_space(component):
+            if component not in collapsed_spaces:
+                collapsed_spaces[component] = self.V.sub(component).collapse()
+            return collapsed_spaces[component]
+
         # TODO refactore this, attach the initial conditions to the objects directly
         for ini in self.initial_conditions:
             value = ini.value
@@ -192,7 +209,7 @@ class HTransportProblem:
             if self.V.num_sub_spaces() == 0:
                 functionspace = self.V
             else:
-                functionspace = self.V.sub(component).collapse()
+                functionspace = get_collapsed_space(component)
 
             if component == 0:
                 self.mobile.initialise(
@@ -207,9 +224,9 @@ class HTransportProblem:
         # assign initial condition for SurfaceKinetics BC
         # iterate through each surface of each SurfaceKinetics
         index = len(self.traps) + 1
-        for bc in self._all_surf_kinetics:
+        for bc in all_surf_kinetics:
             for i in range(len(bc.previous_solutions)):
-                functionspace = self.V.sub(index).collapse()
+                functionspace = get_collapsed_space(index)
                 comp = interpolate(Constant(bc.initial_condition), functionspace)
                 assign(bc.previous_solutions[i], comp)
                 index += 1
@@ -219,7 +236,7 @@ class HTransportProblem:
             if self.V.num_sub_spaces() == 0:
                 functionspace = self.V
             else:
-                functionspace = self.V.sub(0).collapse()
+                functionspace = get_collapsed_space(0)
             initial_guess = project(
                 self.mobile.previous_solution + Constant(DOLFIN_EPS), functionspace
             )
@@ -227,18 +244,18 @@ class HTransportProblem:
         # this is needed to correctly create the formulation
         # TODO: write a test for this?
         if self.V.num_sub_spaces() != 0:
+            solutions = split(self.u)
+            previous_solutions = split(self.u_n)
             index = 0
             for concentration in conc_list:
                 if isinstance(concentration, festim.SurfaceKinetics):
                     for i in range(len(concentration.surfaces)):
-                        concentration.solutions[i] = list(split(self.u))[index]
-                        concentration.previous_solutions[i] = list(split(self.u_n))[
-                            index
-                        ]
+                        concentration.solutions[i] = solutions[index]
+                        concentration.previous_solutions[i] = previous_solutions[index]
                         index += 1
                 else:
-                    concentration.solution = list(split(self.u))[index]
-                    concentration.previous_solution = list(split(self.u_n))[index]
+                    concentration.solution = solutions[index]
+                    concentration.previous_solution = previous_solutions[index]
                     index += 1
 
     def define_variational_problem(self, materials, mesh, dt=None):
@@ -326,14 +343,20 @@ class HTransportProblem:
         """
         festim.update_expressions(self.expressions, t)
 
+        # keep a copy of the initial guess to restart from it if the solver
+        # doesn't converge. The buffer is only allocated once since self.u
+        # isn't replaced between time steps
+        if self.u_backup is None:
+            self.u_backup = Function(self.u.function_space())
+        self.u_backup.assign(self.u)
+
         converged = False
-        u_ = Function(self.u.function_space())
-        u_.assign(self.u)
         while converged is False:
-            self.u.assign(u_)
             nb_it, converged = self.solve_once()
             if dt.adaptive_stepsize is not None or dt.milestones is not None:
                 dt.adapt(t, nb_it, converged)
+            if not converged:
+                self.u.assign(self.u_backup)
 
         # Update previous solutions
         self.update_previous_solutions()
@@ -369,7 +392,11 @@ class HTransportProblem:
         if self.u.function_space().num_sub_spaces() == 0:
             res = [self.u]
         else:
-            res = list(self.u.split())
+            # the sub functions share the vector of self.u so they only need
+            # to be created once
+            if self.u_split is None or self.u_split[0] is not self.u:
+                self.u_split = (self.u, list(self.u.split()))
+            res = self.u_split[1]
 
         for i, trap in enumerate(self.traps, 1):
             trap.post_processing_solution = res[i]
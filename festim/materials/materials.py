@@ -101,7 +101,7 @@ class Materials(list):
             raise ValueError("Borders don't match with size")
         return True
 
-    def check_materials(self, T: festim.Temperature, derived_quantities: list = []):
+    def check_materials(self, T: festim.Temperature, derived_quantities: list = None):
         """Checks the materials keys
 
         Args:
@@ -111,6 +111,9 @@ class Materials(list):
         """
 
         if len(self) > 0:  # TODO: get rid of this...
+            if derived_quantities is None:
+                derived_quantities = []
+
             self.check_consistency()
 
             self.check_for_unused_properties(T, derived_quantities)
@@ -227,6 +230,29 @@ class Materials(list):
                 return material
         raise ValueError("Couldn't find ID " + str(mat_id) + " in materials list")
 
+    def create_material_finder(self, vm):
+        """Creates a function returning the material of a cell from the
+        volume markers. The materials are memoised by subdomain id so that
+        find_material_from_id is only called once per subdomain.
+
+        Args:
+            vm (fenics.MeshFunction): volume markers
+
+        Returns:
+            callable: a function taking a cell index and returning the
+                festim.Material of this cell
+        """
+        vm_array = vm.array()
+        materials_by_id = {}
+
+        def find_material_from_cell(cell_index):
+            subdomain_id = int(vm_array[cell_index])
+            if subdomain_id not in materials_by_id:
+                materials_by_id[subdomain_id] = self.find_material_from_id(subdomain_id)
+            return materials_by_id[subdomain_id]
+
+        return find_material_from_cell
+
     def find_material_from_name(self, name):
         """Returns the material with the correct name
 
@@ -293,6 +319,63 @@ class Materials(list):
         # if no subdomain was found, return 0
         return 0
 
+    def find_subdomains_from_x_coordinates(self, x):
+        """Finds the correct subdomains at several x coordinates.
+        Vectorised equivalent of find_subdomain_from_x_coordinate for
+        non-overlapping borders
+
+        Args:
+            x (np.ndarray): the x coordinates
+
+        Returns:
+            np.ndarray: the corresponding subdomain ids (0 where no
+                subdomain was found)
+        """
+        x = np.asarray(x, dtype=float)
+        lower, upper, ids = [], [], []
+        default_id = 0
+        for material in self:
+            # if no borders are provided, assume only one subdomain
+            if material.borders is None:
+                default_id = material.id
+                break
+            if isinstance(material.borders[0], list) and len(material.borders) > 1:
+                list_of_borders = material.borders
+            else:
+                list_of_borders = [material.borders]
+            if isinstance(material.id, list):
+                subdomains = material.id
+            else:
+                subdomains = [material.id for _ in range(len(list_of_borders))]
+            for borders, subdomain in zip(list_of_borders, subdomains):
+                lower.append(borders[0])
+                upper.append(borders[1])
+                ids.append(subdomain)
+
+        if len(ids) == 0:
+            return np.full(x.shape, default_id, dtype=np.uintp)
+
+        # sort the intervals by upper border, the only candidates for each x
+        # are the first interval ending after it and the next one (which
+        # only contains x if both intervals share a border)
+        order = np.argsort(upper, kind="stable")
+        lower = np.asarray(lower, dtype=float)[order]
+        upper = np.asarray(upper, dtype=float)[order]
+        ids = np.asarray(ids, dtype=np.uintp)[order]
+        # clip the indices so that the lookup is branchless, points after
+        # the last interval fail the upper border check
+        last = len(ids) - 1
+        first = np.minimum(np.searchsorted(upper, x, side="left"), last)
+        second = np.minimum(first + 1, last)
+        in_first = (lower[first] <= x) & (x <= upper[first])
+        in_second = (lower[second] <= x) & (x <= upper[second])
+        # on a shared border, the interval listed first in the materials
+        # wins like in find_subdomain_from_x_coordinate
+        use_second = in_second & (~in_first | (order[second] < order[first]))
+        idx = np.where(use_second, second, first)
+        found = in_first | in_second
+        return np.where(found, ids[idx], np.uintp(default_id))
+
     def create_properties(self, vm, T):
         """Creates the properties fields needed for post processing
 
@@ -375,11 +458,10 @@ class ArheniusCoeff(f.UserExpression):
         self._materials = materials
         self._pre_exp = pre_exp
         self._E = E
+        self._find_material = materials.create_material_finder(vm)
 
     def eval_cell(self, value, x, ufc_cell):
-        cell = f.Cell(self._vm.mesh(), ufc_cell.index)
-        subdomain_id = self._vm[cell]
-        material = self._materials.find_material_from_id(subdomain_id)
+        material = self._find_material(ufc_cell.index)
         D_0 = getattr(material, self._pre_exp)
         E_D = getattr(material, self._E)
         value[0] = D_0 * f.exp(-E_D / k_B / self._T(x))
@@ -395,11 +477,10 @@ class ThermalProp(f.UserExpression):
         self._vm = vm
         self._materials = materials
         self._key = key
+        self._find_material = materials.create_material_finder(vm)
 
     def eval_cell(self, value, x, ufc_cell):
-        cell = f.Cell(self._vm.mesh(), ufc_cell.index)
-        subdomain_id = self._vm[cell]
-        material = self._materials.find_material_from_id(subdomain_id)
+        material = self._find_material(ufc_cell.index)
         attribute = getattr(material, self._key)
         if callable(attribute):
             value[0] = attribute(self._T(x))
@@ -1,4 +1,5 @@
 import fenics as f
+import numpy as np
 from festim import Mesh
 
 
@@ -35,19 +36,15 @@ class Mesh1D(Mesh):
             fenics.MeshFunction: the meshfunction containing the surface
                 markers
         """
+        # the markers are initialised to 0 when created
         surface_markers = f.MeshFunction(
             "size_t", self.mesh, self.mesh.topology().dim() - 1, 0
         )
-        surface_markers.set_all(0)
-        i = 0
-        for facet in f.facets(self.mesh):
-            i += 1
-            x0 = facet.midpoint()
-            surface_markers[facet] = 0
-            if f.near(x0.x(), self.start):
-                surface_markers[facet] = 1
-            if f.near(x0.x(), self.size):
-                surface_markers[facet] = 2
+        # in 1D, facets are the vertices of the mesh
+        x = self.mesh.coordinates()[:, 0]
+        markers = surface_markers.array()
+        markers[np.isclose(x, self.start, rtol=0, atol=f.DOLFIN_EPS)] = 1
+        markers[np.isclose(x, self.size, rtol=0, atol=f.DOLFIN_EPS)] = 2
         return surface_markers
 
     def define_volume_markers(self, materials):
@@ -60,14 +57,15 @@ class Mesh1D(Mesh):
             fenics.MeshFunction: the meshfunction containing the volume
                 markers
         """
-        volume_markers = f.MeshFunction(
-            "size_t", self.mesh, self.mesh.topology().dim(), 0
+        # no initial value needed since all the cells are marked below
+        volume_markers = f.MeshFunction("size_t", self.mesh, self.mesh.topology().dim())
+        # mark the cells based on the position of their midpoints
+        x = self.mesh.coordinates()[:, 0]
+        cells = self.mesh.cells()
+        midpoints = 0.5 * (x[cells[:, 0]] + x[cells[:, 1]])
+        volume_markers.array()[:] = materials.find_subdomains_from_x_coordinates(
+            midpoints
         )
-        # iterate through the cells of the mesh and mark them
-        for cell in f.cells(self.mesh):
-            x = cell.midpoint().x()
-            subdomain_id = materials.find_subdomain_from_x_coordinate(x)
-            volume_markers[cell] = subdomain_id
 
         return volume_markers
 
@@ -1,10 +1,12 @@
 import fenics as f
+import numpy as np
+import festim
 from festim import Mesh1D
 
 
 class MeshFromRefinements(Mesh1D):
     """
-    1D mesh with iterative refinements (on the left hand side of the domain)
+    1D mesh with local refinements (on the left hand side of the domain)
 
     Args:
         initial_number_of_cells (float): initial number of cells before
@@ -12,7 +14,7 @@ class MeshFromRefinements(Mesh1D):
         size (float): total size of the 1D mesh
         refinements (list, optional): list of dicts
             {"x": ..., "cells": ...}. For each refinement, the mesh will
-            have at least ["cells"] in [0, "x"]. Defaults to [].
+            have at least ["cells"] in [0, "x"]. Defaults to None.
         start (float, optional): the starting point of the mesh. Defaults to
             0.
 
@@ -21,45 +23,159 @@ class MeshFromRefinements(Mesh1D):
             refinement
         size (float): total size of the 1D mesh
         refinements (list): list of refinements
+        vertices (np.ndarray): the vertices of the refined mesh
+        previous_mesh (fenics.Mesh): the mesh before the last call to
+            refine_adaptively. None if the mesh hasn't been adaptively
+            refined
     """
 
     def __init__(
-        self, initial_number_of_cells, size, refinements=[], start=0.0, **kwargs
+        self, initial_number_of_cells, size, refinements=None, start=0.0, **kwargs
     ) -> None:
         super().__init__(**kwargs)
         self.initial_number_of_cells = initial_number_of_cells
         self.size = size
         self.start = start
-        self.refinements = refinements
+        self.refinements = [] if refinements is None else refinements
+        self.previous_mesh = None
         self.mesh_and_refine()
 
     def mesh_and_refine(self):
-        """Mesh and refine iteratively until meeting the refinement
-        conditions.
+        """Mesh and refine until meeting the refinement conditions.
+        The vertices of the refined mesh are computed directly and the mesh
+        is built in one pass.
         """
 
         print("Meshing ...")
-        initial_number_of_cells = self.initial_number_of_cells
-        size = self.size
-        mesh = f.IntervalMesh(initial_number_of_cells, self.start, size)
+        vertices = np.linspace(self.start, self.size, self.initial_number_of_cells + 1)
         for refinement in self.refinements:
             nb_cells_ref = refinement["cells"]
-            refinement_point = refinement["x"]
-            print("Mesh size before local refinement is " + str(len(mesh.cells())))
-            coarse_mesh = True
-            while len(mesh.cells()) < initial_number_of_cells + nb_cells_ref:
-                cell_markers = f.MeshFunction("bool", mesh, mesh.topology().dim())
-                cell_markers.set_all(False)
-                for cell in f.cells(mesh):
-                    if cell.midpoint().x() < refinement_point:
-                        cell_markers[cell] = True
-                        coarse_mesh = False
-                mesh = f.refine(mesh, cell_markers)
-                if coarse_mesh:
-                    msg = (
-                        "Infinite loop: Initial number " + "of cells might be too small"
-                    )
-                    raise ValueError(msg)
-            print("Mesh size after local refinement is " + str(len(mesh.cells())))
-            initial_number_of_cells = len(mesh.cells())
-        self.mesh = mesh
+            refinement_point = min(refinement["x"], self.size)
+            print("Mesh size before local refinement is " + str(len(vertices) - 1))
+            if refinement_point > self.start:
+                vertices = self._merge_refinement(
+                    vertices, refinement_point, nb_cells_ref
+                )
+            print("Mesh size after local refinement is " + str(len(vertices) - 1))
+        self.vertices = vertices
+        self.mesh = festim.MeshFromVertices(vertices).mesh
+
+    def refine_adaptively(self, indicator, theta=0.5):
+        """Refines the cells of the mesh with the largest error indicator.
+        The current mesh is refined in place of being rebuilt from the
+        refinements and is stored in previous_mesh.
+        If the markers were already defined, they are carried over from
+        previous_mesh to the refined mesh (and so are the measures).
+        Objects built on the previous mesh (function spaces, forms...)
+        are not updated and the simulation has to be initialised again.
+
+        Args:
+            indicator (np.ndarray): cell-wise error indicator, ordered by
+                cell index of the current mesh
+            theta (float, optional): fraction of the cells to refine, between
+                0 and 1. Defaults to 0.5.
+
+        Raises:
+            ValueError: if indicator doesn't have one value per cell
+            ValueError: if theta isn't in ]0, 1]
+        """
+        indicator = np.asarray(indicator, dtype=float).ravel()
+        nb_cells = self.mesh.num_cells()
+        if indicator.size != nb_cells:
+            raise ValueError(
+                "indicator has {} values but the mesh has {} cells".format(
+                    indicator.size, nb_cells
+                )
+            )
+        if not 0 < theta <= 1:
+            raise ValueError("theta must be in ]0, 1]")
+
+        nb_marked = max(1, int(np.ceil(theta * nb_cells)))
+        top = np.argpartition(indicator, -nb_marked)[-nb_marked:]
+        cell_markers = f.MeshFunction("bool", self.mesh, self.mesh.topology().dim())
+        cell_markers.set_all(False)
+        cell_markers.array()[top] = True
+
+        print("Mesh size before adaptive refinement is " + str(nb_cells))
+        self.previous_mesh = self.mesh
+        self.mesh = f.refine(self.mesh, cell_markers)
+        self.vertices = np.sort(self.mesh.coordinates()[:, 0])
+        print("Mesh size after adaptive refinement is " + str(self.mesh.num_cells()))
+        self._transfer_markers()
+
+    def _transfer_markers(self):
+        """Carries the volume and surface markers of previous_mesh over to
+        the refined mesh and redefines the measures if they were defined.
+        The marker of a new cell is the marker of its parent cell and the
+        new vertices (interior facets) are marked with 0.
+        """
+        old_x = self.previous_mesh.coordinates()[:, 0]
+        new_x = self.mesh.coordinates()[:, 0]
+
+        if self.volume_markers is not None:
+            # the parent of a new cell is the old cell containing its midpoint
+            old_cells = self.previous_mesh.cells()
+            old_left = np.minimum(old_x[old_cells[:, 0]], old_x[old_cells[:, 1]])
+            order = np.argsort(old_left)
+            new_cells = self.mesh.cells()
+            midpoints = 0.5 * (new_x[new_cells[:, 0]] + new_x[new_cells[:, 1]])
+            idx = np.searchsorted(old_left[order], midpoints, side="right") - 1
+            old_markers = self.volume_markers.array()
+            self.volume_markers = f.MeshFunction(
+                "size_t", self.mesh, self.mesh.topology().dim()
+            )
+            self.volume_markers.array()[:] = old_markers[order[idx]]
+
+        if self.surface_markers is not None:
+            # the old vertices are kept as they are by the refinement
+            order = np.argsort(old_x)
+            idx = np.searchsorted(old_x[order], new_x)
+            idx = np.minimum(idx, len(old_x) - 1)
+            found = np.isclose(old_x[order[idx]], new_x, rtol=0, atol=f.DOLFIN_EPS)
+            old_markers = self.surface_markers.array()
+            self.surface_markers = f.MeshFunction(
+                "size_t", self.mesh, self.mesh.topology().dim() - 1, 0
+            )
+            self.surface_markers.array()[found] = old_markers[order[idx[found]]]
+
+        if self.dx is not None or self.ds is not None:
+            # Mesh1D.define_measures needs the materials to redefine the markers
+            super(Mesh1D, self).define_measures()
+
+    def _merge_refinement(self, vertices, refinement_point, nb_cells_ref):
+        """Merges a uniform refinement of [start, refinement_point] into the
+        existing vertices.
+        In the refinement zone, the existing vertices are only kept where
+        the existing mesh is already finer than the refinement, and the
+        refined vertices closer than half the refined spacing from a kept
+        vertex are dropped so that no sliver cell is created.
+
+        Args:
+            vertices (np.ndarray): the sorted existing vertices
+            refinement_point (float): the end of the refinement zone
+            nb_cells_ref (int): the number of cells in the refinement zone
+
+        Returns:
+            np.ndarray: the sorted merged vertices
+        """
+        spacing = (refinement_point - self.start) / nb_cells_ref
+        refined_vertices = np.linspace(self.start, refinement_point, nb_cells_ref + 1)
+
+        # width of the finest cell adjacent to each existing vertex
+        widths = np.diff(vertices)
+        local_width = np.minimum(
+            np.append(widths, np.inf), np.insert(widths, 0, np.inf)
+        )
+        keep = (vertices >= refinement_point) | (local_width <= spacing)
+        kept_vertices = vertices[keep]
+
+        # distance from each refined vertex to the closest kept vertex
+        idx = np.searchsorted(kept_vertices, refined_vertices)
+        left = kept_vertices[np.maximum(idx - 1, 0)]
+        right = kept_vertices[np.minimum(idx, len(kept_vertices) - 1)]
+        distance = np.minimum(
+            np.abs(refined_vertices - left), np.abs(right - refined_vertices)
+        )
+        refined_vertices = refined_vertices[distance >= 0.5 * spacing]
+
+        return np.union1d(kept_vertices, refined_vertices)
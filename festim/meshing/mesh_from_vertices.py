@@ -28,17 +28,23 @@ class MeshFromVertices(Mesh1D):
         # the following is needed to avoid breaking in parrallel
         # see issue 497
         if f.MPI.comm_world.rank == 0:
-            vertices = sorted(np.unique(self.vertices))
+            # np.unique returns the sorted vertices
+            vertices = np.unique(self.vertices).astype(float).reshape(-1, 1)
             nb_points = len(vertices)
             nb_cells = nb_points - 1
+            cells = np.stack(
+                [np.arange(nb_cells), np.arange(1, nb_cells + 1)], axis=1
+            ).astype(np.uintp)
             editor = f.MeshEditor()
             editor.open(mesh, "interval", 1, 1)  # top. and geom. dimension are both 1
             editor.init_vertices(nb_points)  # number of vertices
             editor.init_cells(nb_cells)  # number of cells
-            for i in range(0, nb_points):
-                editor.add_vertex(i, np.array([vertices[i]]))
-            for j in range(0, nb_cells):
-                editor.add_cell(j, np.array([j, j + 1]))
+            # pass rows of the precomputed arrays to avoid allocating
+            # a new array for each vertex and cell
+            for i in range(nb_points):
+                editor.add_vertex(i, vertices[i])
+            for j in range(nb_cells):
+                editor.add_cell(j, cells[j])
             editor.close()
         f.MeshPartitioning.build_distributed_mesh(mesh)
         self.mesh = mesh
@@ -23,24 +23,36 @@ class MeshFromXDMF(Mesh):
         self.boundary_file = boundary_file
 
         self.mesh = f.Mesh()
-        f.XDMFFile(self.volume_file).read(self.mesh)
-
-        self.define_markers()
-
-    def define_markers(self):
-        """Reads volume and surface entities from XDMF files"""
+        # the volume file is opened once to read both the mesh and the
+        # volume markers
+        with f.XDMFFile(self.volume_file) as volume_xdmf:
+            volume_xdmf.read(self.mesh)
+            self.define_markers(volume_xdmf=volume_xdmf)
+
+    def define_markers(self, volume_xdmf=None):
+        """Reads volume and surface entities from XDMF files
+
+        Args:
+            volume_xdmf (fenics.XDMFFile, optional): the opened volume file.
+                If None, self.volume_file is opened. Defaults to None.
+        """
         mesh = self.mesh
 
         # Read tags for volume elements
         volume_markers = f.MeshFunction("size_t", mesh, mesh.topology().dim())
-        f.XDMFFile(self.volume_file).read(volume_markers)
+        if volume_xdmf is None:
+            with f.XDMFFile(self.volume_file) as volume_xdmf:
+                volume_xdmf.read(volume_markers)
+        else:
+            volume_xdmf.read(volume_markers)
 
         # Read tags for surface elements
         # (can also be used for applying DirichletBC)
         surface_markers = f.MeshValueCollection(
             "size_t", mesh, mesh.topology().dim() - 1
         )
-        f.XDMFFile(self.boundary_file).read(surface_markers, "f")
+        with f.XDMFFile(self.boundary_file) as boundary_xdmf:
+            boundary_xdmf.read(surface_markers, "f")
         surface_markers = f.MeshFunction("size_t", mesh, surface_markers)
 
         print("Succesfully load mesh with " + str(len(volume_markers)) + " cells")
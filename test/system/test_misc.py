@@ -356,6 +356,35 @@ def test_small_timesteps_final_time_bug():
     assert np.isclose(my_model.t, my_model.settings.final_time, atol=0.0)
 
 
+def test_display_time_throttled(capsys):
+    """
+    Checks that the progress message isn't refreshed within display_interval
+    but that the final time is always displayed
+    """
+    my_model = F.Simulation(log_level=40)
+    my_model.mesh = F.MeshFromVertices(np.linspace(0, 1, 10))
+    my_model.materials = F.Material(1, 1, 0.1)
+    my_model.T = F.Temperature(1000)
+    my_model.settings = F.Settings(1e-10, 1e-10, final_time=10)
+    my_model.dt = F.Stepsize(1)
+    my_model.initialise()
+    my_model.timer = f.Timer()
+    my_model.display_interval = 1e3
+    capsys.readouterr()
+
+    my_model.t = 1
+    my_model.display_time()
+    assert "10.0 %" in capsys.readouterr().out
+
+    my_model.t = 2
+    my_model.display_time()
+    assert capsys.readouterr().out == ""
+
+    my_model.t = 10
+    my_model.display_time()
+    assert "100.0 %" in capsys.readouterr().out
+
+
 def test_materials_setter():
     """
     Checks that @materials.setter properly assigns F.Materials to F.Simulation.materials
@@ -89,6 +89,27 @@ class TestCompute:
         flux = self.my_h_flux.compute(soret=True)
         assert flux == expected_flux
 
+    def test_compiled_form_updated_with_function(self):
+        """Checks that the compiled form is reused when the function is
+        the same and recompiled when the function changes"""
+        my_flux = SurfaceFlux("solute", self.surface)
+        my_flux.D = self.D
+        my_flux.function = self.c
+        my_flux.n = self.n
+        my_flux.ds = self.ds
+
+        my_flux.compute()
+        form = my_flux._compiled_forms["flux"][1]
+        my_flux.compute()
+        assert my_flux._compiled_forms["flux"][1] is form
+
+        my_flux.function = self.T
+        expected_flux = f.assemble(
+            self.D * f.dot(f.grad(self.T), self.n) * self.ds(self.surface)
+        )
+        assert my_flux.compute() == expected_flux
+        assert my_flux._compiled_forms["flux"][1] is not form
+
 
 @pytest.mark.parametrize("radius", [2, 3])
 @pytest.mark.parametrize("r0", [0, 2])
@@ -1,4 +1,5 @@
 import festim as F
+from festim.materials.materials import ThermalProp
 from fenics import *
 import pytest
 import warnings
@@ -448,3 +449,68 @@ def test_instanciate_with_no_elements():
     """
     # define exports
     F.Materials()
+
+
+@pytest.mark.parametrize(
+    "materials",
+    [
+        [
+            F.Material(id=1, D_0=1, E_D=0, borders=[0, 0.5]),
+            F.Material(id=2, D_0=1, E_D=0, borders=[0.5, 1]),
+        ],
+        [
+            F.Material(id=2, D_0=1, E_D=0, borders=[0.5, 1]),
+            F.Material(id=1, D_0=1, E_D=0, borders=[0, 0.5]),
+        ],
+        [F.Material(id=[1, 2], D_0=1, E_D=0, borders=[[0, 0.25], [0.25, 1]])],
+        [F.Material(id=1, D_0=1, E_D=0, borders=[[0, 0.3], [0.7, 1]])],
+        [F.Material(id=3, D_0=1, E_D=0)],
+    ],
+)
+def test_find_subdomains_from_x_coordinates(materials):
+    """Checks that find_subdomains_from_x_coordinates() matches
+    find_subdomain_from_x_coordinate() at every point
+    """
+    my_mats = F.Materials(materials)
+    x = [0, 0.1, 0.25, 0.3, 0.5, 0.6, 0.8, 1, 1.2]
+
+    computed = my_mats.find_subdomains_from_x_coordinates(x)
+
+    expected = [my_mats.find_subdomain_from_x_coordinate(x_) for x_ in x]
+    assert list(computed) == expected
+
+
+def test_create_material_finder():
+    """Checks that the function created by create_material_finder() returns
+    the material of each cell"""
+    mesh = UnitIntervalMesh(4)
+    vm = MeshFunction("size_t", mesh, 1)
+    vm.array()[:] = [1, 1, 2, 2]
+    mat_1 = F.Material(id=1, D_0=1, E_D=0)
+    mat_2 = F.Material(id=2, D_0=2, E_D=0)
+    my_mats = F.Materials([mat_1, mat_2])
+
+    find_material = my_mats.create_material_finder(vm)
+
+    assert [find_material(i) for i in range(4)] == [mat_1, mat_1, mat_2, mat_2]
+
+
+def test_thermal_prop_two_materials():
+    """Checks that ThermalProp gives each cell the value of its material"""
+    mesh = UnitIntervalMesh(4)
+    vm = MeshFunction("size_t", mesh, 1)
+    vm.array()[:] = [1, 2, 2, 1]
+    my_mats = F.Materials(
+        [
+            F.Material(id=1, D_0=1, E_D=0, thermal_cond=3),
+            F.Material(id=2, D_0=1, E_D=0, thermal_cond=lambda T: 2 * T),
+        ]
+    )
+    T = Constant(5)
+    thermal_cond = ThermalProp(my_mats, vm, T, "thermal_cond", degree=0)
+
+    V = FunctionSpace(mesh, "DG", 0)
+    thermal_cond = interpolate(thermal_cond, V)
+
+    computed = [thermal_cond.vector()[V.dofmap().cell_dofs(i)[0]] for i in range(4)]
+    assert computed == pytest.approx([3, 10, 10, 3])
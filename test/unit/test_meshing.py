@@ -290,8 +290,9 @@ def test_generate_mesh_from_vertices():
 
 def test_mesh_refinement_course_mesh():
     """
-    Test for MeshFromRefinements, when mesh too coarse for refinement
-        - return error
+    Test for MeshFromRefinements, when the initial mesh is much coarser
+    than the refinement zone
+        - the refinement conditions are still met
     """
     mesh_parameters = {
         "initial_number_of_cells": 2,
@@ -301,8 +302,82 @@ def test_mesh_refinement_course_mesh():
         ],
     }
 
-    with pytest.raises(
-        ValueError,
-        match="Infinite loop: Initial number " + "of cells might be too small",
-    ):
-        MeshFromRefinements(**mesh_parameters)
+    my_mesh = MeshFromRefinements(**mesh_parameters)
+
+    nb_cells_refined = 0
+    for cell in fenics.cells(my_mesh.mesh):
+        if cell.midpoint().x() < 0.00001:
+            nb_cells_refined += 1
+    assert nb_cells_refined >= 3
+    assert my_mesh.mesh.coordinates().min() == pytest.approx(0)
+    assert my_mesh.mesh.coordinates().max() == pytest.approx(10)
+
+
+def test_mesh_refinement_no_sliver_cells():
+    """
+    Test for MeshFromRefinements, when the refinement point doesn't match
+    a vertex of the initial mesh
+        - the refinement zone has the required number of cells
+        - no cell is much smaller than its neighbours
+    """
+    my_mesh = MeshFromRefinements(
+        initial_number_of_cells=100,
+        size=1,
+        refinements=[{"cells": 1000, "x": 0.3337}],
+    )
+    widths = np.diff(np.sort(my_mesh.mesh.coordinates()[:, 0]))
+    refined_spacing = 0.3337 / 1000
+    coarse_spacing = 1 / 100
+
+    assert np.count_nonzero(my_mesh.vertices[1:] <= 0.3337) == 1000
+    assert widths.min() >= 0.5 * refined_spacing
+    neighbour_ratios = np.maximum(widths[1:] / widths[:-1], widths[:-1] / widths[1:])
+    assert neighbour_ratios.max() <= coarse_spacing / refined_spacing
+
+
+def test_mesh_refine_adaptively():
+    """
+    Test for MeshFromRefinements.refine_adaptively
+        - only the cells with the largest indicator are refined
+        - the previous mesh is kept
+        - the markers and measures are carried over to the refined mesh
+    """
+    my_mesh = MeshFromRefinements(initial_number_of_cells=4, size=1)
+    materials = Materials(
+        [
+            Material(id=1, D_0=1, E_D=0, borders=[0, 0.5]),
+            Material(id=2, D_0=1, E_D=0, borders=[0.5, 1]),
+        ]
+    )
+    my_mesh.define_measures(materials)
+    initial_mesh = my_mesh.mesh
+    indicator = np.zeros(initial_mesh.num_cells())
+    indicator[-1] = 1
+
+    my_mesh.refine_adaptively(indicator, theta=0.25)
+
+    assert my_mesh.previous_mesh is initial_mesh
+    assert my_mesh.mesh.num_cells() == 5
+    # the refined cell is the one on the right
+    assert np.allclose(my_mesh.vertices, [0, 0.25, 0.5, 0.75, 0.875, 1])
+
+    # the markers are defined on the refined mesh
+    x = my_mesh.mesh.coordinates()[:, 0]
+    midpoints = x[my_mesh.mesh.cells()].mean(axis=1)
+    assert my_mesh.volume_markers.mesh().id() == my_mesh.mesh.id()
+    assert np.array_equal(
+        my_mesh.volume_markers.array(), np.where(midpoints < 0.5, 1, 2)
+    )
+    expected_surface_markers = np.where(x == 0, 1, np.where(x == 1, 2, 0))
+    assert np.array_equal(my_mesh.surface_markers.array(), expected_surface_markers)
+    assert my_mesh.dx.subdomain_data() is my_mesh.volume_markers
+    assert my_mesh.ds.subdomain_data() is my_mesh.surface_markers
+
+
+@pytest.mark.parametrize("nb_values,theta", [(3, 0.5), (4, 0), (4, 1.5)])
+def test_mesh_refine_adaptively_wrong_arguments(nb_values, theta):
+    """Checks that refine_adaptively raises an error with an indicator of
+    the wrong size or a theta out of bounds"""
+    my_mesh = MeshFromRefinements(initial_number_of_cells=4, size=1)
+    with pytest.raises(ValueError):
+        my_mesh.refine_adaptively(np.ones(nb_values), theta=theta)
@@ -170,8 +170,9 @@ class TestCreateDiffusionForm:
         D = self.mat1.D_0 * f.exp(-self.mat1.E_D / festim.k_B / self.my_temp.T)
         c_0 = my_mobile.solution
         c_0_n = my_mobile.previous_solution
-        expected_form = ((c_0 - c_0_n) / self.dt.value) * v * self.my_mesh.dx(1)
-        expected_form += f.dot(D * f.grad(c_0), f.grad(v)) * self.my_mesh.dx(1)
+        expected_form = (
+            ((c_0 - c_0_n) / self.dt.value) * v + f.dot(D * f.grad(c_0), f.grad(v))
+        ) * self.my_mesh.dx(1)
         form_trapping_expected = 0
         for trap in my_traps:
             form_trapping_expected += (
@@ -182,15 +183,11 @@ class TestCreateDiffusionForm:
                     * (trap.density[0] - trap.solution)
                 )
                 * v
-                * self.my_mesh.dx(1)
-            )
-            form_trapping_expected += (
-                trap.p_0
+                + trap.p_0
                 * f.exp(-trap.E_p / festim.k_B / self.my_temp.T)
                 * trap.solution
                 * v
-                * self.my_mesh.dx(1)
-            )
+            ) * self.my_mesh.dx(1)
         expected_form += -form_trapping_expected
         print("expected F:")
         print(expected_form)
@@ -228,10 +225,12 @@ class TestCreateDiffusionForm:
         D2 = self.mat2.D_0 * f.exp(-self.mat2.E_D / festim.k_B / self.my_temp.T)
         c_0 = my_mobile.solution
         c_0_n = my_mobile.previous_solution
-        expected_form = ((c_0 - c_0_n) / self.dt.value) * v * self.my_mesh.dx(1)
-        expected_form += ((c_0 - c_0_n) / self.dt.value) * v * self.my_mesh.dx(2)
-        expected_form += f.dot(D1 * f.grad(c_0), f.grad(v)) * self.my_mesh.dx(1)
-        expected_form += f.dot(D2 * f.grad(c_0), f.grad(v)) * self.my_mesh.dx(2)
+        expected_form = (
+            ((c_0 - c_0_n) / self.dt.value) * v + f.dot(D1 * f.grad(c_0), f.grad(v))
+        ) * self.my_mesh.dx(1)
+        expected_form += (
+            ((c_0 - c_0_n) / self.dt.value) * v + f.dot(D2 * f.grad(c_0), f.grad(v))
+        ) * self.my_mesh.dx(2)
         form_trapping_expected = 0
         for i in range(2):
             form_trapping_expected += (
@@ -242,15 +241,11 @@ class TestCreateDiffusionForm:
                     * (trap1.density[i] - trap1.solution)
                 )
                 * v
-                * self.my_mesh.dx(i + 1)
-            )
-            form_trapping_expected += (
-                trap1.p_0[i]
+                + trap1.p_0[i]
                 * f.exp(-trap1.E_p[i] / festim.k_B / self.my_temp.T)
                 * trap1.solution
                 * v
-                * self.my_mesh.dx(i + 1)
-            )
+            ) * self.my_mesh.dx(i + 1)
         expected_form += -form_trapping_expected
         print("expected F:")
         print(expected_form)
@@ -72,8 +72,9 @@ class TestCreateDiffusionForm:
         S_n = mat1.S_0 * f.exp(-mat1.E_S / festim.k_B / self.my_temp.T_n)
         c_0 = my_theta.solution * S
         c_0_n = my_theta.previous_solution * S_n
-        expected_form = ((c_0 - c_0_n) / self.dt.value) * v * self.my_mesh.dx(1)
-        expected_form += f.dot(D * f.grad(c_0), f.grad(v)) * self.my_mesh.dx(1)
+        expected_form = (
+            ((c_0 - c_0_n) / self.dt.value) * v + f.dot(D * f.grad(c_0), f.grad(v))
+        ) * self.my_mesh.dx(1)
 
         print("expected F:")
         print(expected_form)
@@ -105,8 +106,9 @@ class TestCreateDiffusionForm:
         K_H_n = mat2.S_0 * f.exp(-mat2.E_S / festim.k_B / self.my_temp.T_n)
         c_0 = my_theta.solution**2 * K_H
         c_0_n = my_theta.previous_solution**2 * K_H_n
-        expected_form = ((c_0 - c_0_n) / self.dt.value) * v * self.my_mesh.dx(2)
-        expected_form += f.dot(D * f.grad(c_0), f.grad(v)) * self.my_mesh.dx(2)
+        expected_form = (
+            ((c_0 - c_0_n) / self.dt.value) * v + f.dot(D * f.grad(c_0), f.grad(v))
+        ) * self.my_mesh.dx(2)
 
         print("expected F:")
         print(expected_form)